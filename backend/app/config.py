@@ -9,12 +9,24 @@ class Settings(BaseSettings):
 
     poll_interval_ms: int = Field(1000, ge=100, description="Telemetry poll interval in milliseconds")
     ws_max_rate_hz: int = Field(5, ge=1, le=30, description="Maximum WebSocket broadcast frequency")
+    snapshot_max_wait_s: float = Field(
+        30.0, gt=0, description="Upper bound for the /api/snapshot long-poll wait in seconds"
+    )
+    alert_rules_path: Optional[str] = Field(
+        None, description="JSON file with server-side alert rules; alerting is off when unset"
+    )
     log_level: str = Field("INFO", description="Python logging level")
     enable_system_metrics: bool = Field(True, description="Include host system metrics when available")
     telemetry_provider: Optional[str] = Field(
         None,
-        description="Force telemetry provider: 'pynvml', 'nvidia_smi', or 'nvtop'. Auto-detect when unset.",
+        description="Force telemetry provider: 'pynvml', 'nvidia_smi', 'nvtop' or 'replay'. Auto-detect when unset.",
+    )
+    record_path: Optional[str] = Field(
+        None, description="Append every streamed telemetry frame to this recording file"
     )
+    replay_path: Optional[str] = Field(None, description="Recording played back by the replay provider")
+    replay_speed: float = Field(1.0, gt=0, description="Replay speed multiplier, e.g. 10 for 10x")
+    replay_loop: bool = Field(True, description="Restart the replay from the beginning when it ends")
 
     class Config:
         env_prefix = "GPU_MONITOR_"
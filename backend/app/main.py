@@ -1,16 +1,23 @@
 import asyncio
+import logging
 from datetime import datetime
+from typing import Optional
 
-from fastapi import Depends, FastAPI, WebSocket
+from fastapi import Depends, FastAPI, Header, Query, Response, WebSocket
 from starlette.websockets import WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .config import Settings, get_settings
 from .core.logging import configure_logging
+from .services.alerts import AlertEngine, load_rules
+from .services.compression import SCHEMA_DICTIONARY
 from .services.connection_manager import ConnectionManager
+from .services.snapshot_store import SnapshotStore
 from .telemetry.factory import get_telemetry_provider
+from .telemetry.recording import TelemetryRecorder
 
+LOGGER = logging.getLogger(__name__)
 
 app = FastAPI(title="GPU Monitoring Service", version="1.0.0")
 
@@ -26,7 +33,12 @@ settings = get_settings()
 configure_logging(settings.log_level)
 
 connection_manager = ConnectionManager(broadcast_hz=settings.ws_max_rate_hz)
+snapshot_store = SnapshotStore()
+alert_engine = AlertEngine(
+    load_rules(settings.alert_rules_path) if settings.alert_rules_path else []
+)
 telemetry_provider = get_telemetry_provider(settings)
+recorder = TelemetryRecorder(settings.record_path) if settings.record_path else None
 
 
 @app.on_event("startup")
@@ -37,6 +49,8 @@ async def startup_event() -> None:
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     await telemetry_provider.stop()
+    if recorder is not None:
+        recorder.close()
 
 
 @app.get("/api/health", name="health")
@@ -57,10 +71,51 @@ async def config(settings: Settings = Depends(get_settings)) -> JSONResponse:
         "maxBroadcastHz": settings.ws_max_rate_hz,
         "provider": telemetry_provider.name,
         "enableSystemMetrics": settings.enable_system_metrics,
+        "wsSubprotocols": connection_manager.subprotocols,
+    }
+    return JSONResponse(payload)
+
+
+@app.get("/api/alerts", name="alerts")
+async def alerts() -> JSONResponse:
+    payload = {
+        "rules": len(alert_engine.rules),
+        "active": alert_engine.active,
+        "recent": alert_engine.recent,
     }
     return JSONResponse(payload)
 
 
+@app.get("/api/ws/dictionary", name="ws_dictionary")
+async def ws_dictionary() -> Response:
+    """Preset dictionary needed to decompress frames on compressed subprotocols."""
+
+    return Response(content=SCHEMA_DICTIONARY, media_type="application/octet-stream")
+
+
+@app.get("/api/snapshot", name="snapshot")
+async def snapshot(
+    gpu: Optional[list[int]] = Query(None, description="Restrict the payload to these GPU ids"),
+    wait: float = Query(0.0, ge=0, description="Seconds to block waiting for a newer sample"),
+    if_none_match: Optional[str] = Header(None),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    known = snapshot_store.parse_etag(if_none_match)
+    # A tag from another process (e.g. before a restart) is stale: answer immediately.
+    if wait > 0 and (if_none_match is None or known is not None):
+        after = known if known is not None else snapshot_store.sequence
+        await snapshot_store.wait_for_change(after, min(wait, settings.snapshot_max_wait_s))
+
+    body = snapshot_store.encoded(gpu)
+    if body is None:
+        return JSONResponse({"detail": "No telemetry sample available yet"}, status_code=503)
+
+    headers = {"ETag": snapshot_store.etag, "Cache-Control": "no-cache"}
+    if known == snapshot_store.sequence:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.websocket("/ws/gpu")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     await connection_manager.connect(websocket)
@@ -75,12 +130,39 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         await connection_manager.disconnect(websocket)
 
 
+async def broadcast_loop() -> None:
+    sink = recorder
+    async for frame in telemetry_provider.stream():
+        message = snapshot_store.publish(frame)
+        if sink is not None:
+            try:
+                await asyncio.to_thread(sink.write, message)
+            except Exception:
+                # Recording is a debugging aid; never let it stop the telemetry stream.
+                LOGGER.exception("Telemetry recording failed; recording disabled")
+                await asyncio.to_thread(close_quietly, sink)
+                sink = None
+        if alert_engine.rules:
+            # Large rule sets take milliseconds per frame; keep them off the event loop.
+            try:
+                events = await asyncio.to_thread(alert_engine.evaluate, frame)
+            except Exception:
+                LOGGER.exception("Alert evaluation failed for frame")
+                events = []
+            for event in events:
+                await connection_manager.broadcast_event(event)
+        await connection_manager.broadcast_encoded(message)
+
+
 @app.on_event("startup")
 async def start_broadcast_loop() -> None:
-    async def broadcast_loop() -> None:
-        async for payload in telemetry_provider.stream():
-            await connection_manager.broadcast(payload)
-
     asyncio.create_task(broadcast_loop())
 
 
+def close_quietly(sink: TelemetryRecorder) -> None:
+    try:
+        sink.close()
+    except Exception:
+        LOGGER.debug("Closing failed recorder raised", exc_info=True)
+
+
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+import operator
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from ..telemetry.models import GpuSample, TelemetryFrame
+
+
+def memory_percent(gpu: GpuSample) -> Optional[float]:
+    if gpu.memory_used is None or not gpu.memory_total:
+        return None
+    return gpu.memory_used / gpu.memory_total * 100
+
+
+def power_percent(gpu: GpuSample) -> Optional[float]:
+    if gpu.power_usage is None or not gpu.power_limit:
+        return None
+    return gpu.power_usage / gpu.power_limit * 100
+
+
+# Metrics are named after the keys of the ``/ws/gpu`` GPU payload, plus derived percentages.
+METRICS: Dict[str, Callable[[GpuSample], Optional[float]]] = {
+    "utilization": operator.attrgetter("utilization"),
+    "memoryUsed": operator.attrgetter("memory_used"),
+    "memoryFree": operator.attrgetter("memory_free"),
+    "memoryPercent": memory_percent,
+    "temperature": operator.attrgetter("temperature"),
+    "powerUsage": operator.attrgetter("power_usage"),
+    "powerPercent": power_percent,
+    "fanSpeed": operator.attrgetter("fan_speed"),
+    "encoderUtilization": operator.attrgetter("encoder_utilization"),
+    "decoderUtilization": operator.attrgetter("decoder_utilization"),
+}
+
+OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+TRENDS = ("rising", "falling")
+
+
+@dataclass(slots=True)
+class AlertRule:
+    """Threshold rule evaluated for every GPU on every sample.
+
+    The rule fires once ``metric op threshold`` has held continuously for ``for_s``
+    seconds and, when ``trend`` is set, the smoothed rate of change over roughly
+    ``window_s`` seconds points in that direction.
+    """
+
+    id: str
+    metric: str
+    op: str
+    threshold: float
+    for_s: float = 0.0
+    trend: Optional[str] = None
+    window_s: float = 30.0
+    severity: str = "warning"
+
+    def __post_init__(self) -> None:
+        if self.metric not in METRICS:
+            raise ValueError(f"alert rule {self.id}: unknown metric {self.metric!r}")
+        if self.op not in OPERATORS:
+            raise ValueError(f"alert rule {self.id}: unknown operator {self.op!r}")
+        if self.trend is not None and self.trend not in TRENDS:
+            raise ValueError(f"alert rule {self.id}: trend must be one of {TRENDS}")
+        if self.for_s < 0 or self.window_s <= 0:
+            raise ValueError(f"alert rule {self.id}: for_s must be >= 0 and window_s > 0")
+
+
+def load_rules(path: Union[str, Path]) -> List[AlertRule]:
+    """Load alert rules from a JSON file holding a list of rule objects."""
+
+    return [AlertRule(**item) for item in json.loads(Path(path).read_text())]
+
+
+class RuleState:
+    """Per-rule rolling state stored as parallel arrays indexed by GPU slot."""
+
+    __slots__ = ("since", "firing", "last_value", "last_time", "slope")
+
+    def __init__(self) -> None:
+        self.since: List[Optional[float]] = []
+        self.firing: List[bool] = []
+        self.last_value: List[Optional[float]] = []
+        self.last_time: List[Optional[float]] = []
+        self.slope: List[float] = []
+
+    def grow(self, size: int) -> None:
+        missing = size - len(self.firing)
+        if missing > 0:
+            self.since.extend([None] * missing)
+            self.firing.extend([False] * missing)
+            self.last_value.extend([None] * missing)
+            self.last_time.extend([None] * missing)
+            self.slope.extend([0.0] * missing)
+
+
+class AlertEngine:
+    """Evaluate alert rules incrementally as telemetry frames arrive.
+
+    Each (rule, GPU) pair keeps O(1) state: when its condition started holding,
+    whether it is firing, and an exponentially smoothed rate of change for trend
+    checks. Metric columns are extracted once per frame and shared by all rules.
+
+    Alerts for a GPU that disappears from the telemetry are resolved with
+    ``reason: "gpu-missing"``. ``evaluate`` may run in a worker thread; the
+    ``active``/``recent`` views are safe to read concurrently.
+    """
+
+    def __init__(self, rules: List[AlertRule], history: int = 100) -> None:
+        ids = [rule.id for rule in rules]
+        if len(set(ids)) != len(ids):
+            raise ValueError("alert rule ids must be unique")
+        self.rules = list(rules)
+        self._states = [RuleState() for _ in self.rules]
+        self._metrics = sorted({rule.metric for rule in self.rules})
+        self._slots: Dict[int, int] = {}
+        self._active: Dict[tuple[str, int], Dict] = {}
+        self._recent: deque[Dict] = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> List[Dict]:
+        with self._lock:
+            return list(self._active.values())
+
+    @property
+    def recent(self) -> List[Dict]:
+        with self._lock:
+            return list(self._recent)
+
+    def evaluate(self, frame: TelemetryFrame) -> List[Dict]:
+        """Advance every rule by one sample and return the resulting alert events."""
+
+        if not self.rules:
+            return []
+
+        gpu_ids = [gpu.id for gpu in frame.gpus]
+        slots = [self._slot(gpu_id) for gpu_id in gpu_ids]
+        columns = {metric: [METRICS[metric](gpu) for gpu in frame.gpus] for metric in self._metrics}
+        now = frame.timestamp
+        events: List[Dict] = []
+
+        for rule, state in zip(self.rules, self._states):
+            state.grow(len(self._slots))
+            compare = OPERATORS[rule.op]
+            threshold = rule.threshold
+            trend = rule.trend
+            since, firing = state.since, state.firing
+            last_value, last_time, slope = state.last_value, state.last_time, state.slope
+
+            for gpu_id, slot, value in zip(gpu_ids, slots, columns[rule.metric]):
+                if value is None:
+                    last_value[slot] = last_time[slot] = None
+                    slope[slot] = 0.0
+                    matched = False
+                elif trend is None:
+                    matched = compare(value, threshold)
+                else:
+                    previous_time = last_time[slot]
+                    if previous_time is not None and now > previous_time:
+                        elapsed = now - previous_time
+                        rate = (value - last_value[slot]) / elapsed
+                        slope[slot] += min(elapsed / rule.window_s, 1.0) * (rate - slope[slot])
+                    last_value[slot], last_time[slot] = value, now
+                    matched = compare(value, threshold)
+                    if matched:
+                        matched = slope[slot] > 0 if trend == "rising" else slope[slot] < 0
+
+                if matched:
+                    if since[slot] is None:
+                        since[slot] = now
+                    if not firing[slot] and now - since[slot] >= rule.for_s:
+                        firing[slot] = True
+                        events.append(self._transition(rule, gpu_id, "firing", value, now))
+                else:
+                    since[slot] = None
+                    if firing[slot]:
+                        firing[slot] = False
+                        events.append(self._transition(rule, gpu_id, "resolved", value, now))
+
+        if len(slots) < len(self._slots):
+            events.extend(self._resolve_missing(set(slots), now))
+        return events
+
+    def _resolve_missing(self, present: set[int], now: float) -> List[Dict]:
+        missing = [(gpu_id, slot) for gpu_id, slot in self._slots.items() if slot not in present]
+        events: List[Dict] = []
+        for rule, state in zip(self.rules, self._states):
+            state.grow(len(self._slots))
+            for gpu_id, slot in missing:
+                state.since[slot] = state.last_value[slot] = state.last_time[slot] = None
+                state.slope[slot] = 0.0
+                if state.firing[slot]:
+                    state.firing[slot] = False
+                    events.append(
+                        self._transition(rule, gpu_id, "resolved", None, now, "gpu-missing")
+                    )
+        return events
+
+    def _slot(self, gpu_id: int) -> int:
+        slot = self._slots.get(gpu_id)
+        if slot is None:
+            slot = self._slots[gpu_id] = len(self._slots)
+        return slot
+
+    def _transition(
+        self,
+        rule: AlertRule,
+        gpu_id: int,
+        state: str,
+        value: Optional[float],
+        now: float,
+        reason: Optional[str] = None,
+    ) -> Dict:
+        event = {
+            "type": "alert",
+            "state": state,
+            "rule": rule.id,
+            "gpu": gpu_id,
+            "metric": rule.metric,
+            "value": value,
+            "threshold": rule.threshold,
+            "severity": rule.severity,
+            "timestamp": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+        }
+        if reason is not None:
+            event["reason"] = reason
+        with self._lock:
+            if state == "firing":
+                self._active[(rule.id, gpu_id)] = event
+            else:
+                self._active.pop((rule.id, gpu_id), None)
+            self._recent.append(event)
+        return event
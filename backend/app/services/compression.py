@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import abc
+import json
+import zlib
+from typing import Optional
+
+from ..telemetry.models import GpuSample, ProcessSample, SystemSample, TelemetryFrame
+
+try:  # pragma: no cover - optional dependency
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover - fallback path
+    zstandard = None
+
+
+def build_schema_dictionary() -> bytes:
+    """Return a preset dictionary made of a representative wire payload.
+
+    Every frame repeats the same camelCase keys, so priming the compressor with
+    them shrinks small frames far more than compressing each one from scratch.
+    """
+
+    frame = TelemetryFrame(
+        timestamp=0.0,
+        gpus=[
+            GpuSample(
+                id=0,
+                uuid="GPU-00000000-0000-0000-0000-000000000000",
+                name="NVIDIA ",
+                driver_version="",
+                processes=[ProcessSample(pid=0, name="python", used_memory_mib=0)],
+            )
+        ],
+        system=SystemSample(
+            cpu_usage=0.0,
+            memory_usage=0.0,
+            memory_used=0,
+            memory_total=0,
+            load_average=(0.0, 0.0, 0.0),
+            uptime_seconds=0,
+            hostname="",
+        ),
+    )
+    return json.dumps(frame.to_wire()).encode()
+
+
+SCHEMA_DICTIONARY = build_schema_dictionary()
+
+
+class FrameCodec(abc.ABC):
+    """Compress an encoded frame for clients that negotiated ``subprotocol``."""
+
+    subprotocol: str = ""
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Return ``data`` compressed as a self-contained message."""
+
+
+class DeflateCodec(FrameCodec):
+    subprotocol = "gpu-telemetry.deflate"
+
+    def __init__(self, level: int = 6) -> None:
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = zlib.compressobj(self._level, zdict=SCHEMA_DICTIONARY)
+        return compressor.compress(data) + compressor.flush()
+
+
+class ZstdCodec(FrameCodec):
+    subprotocol = "gpu-telemetry.zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        if zstandard is None:
+            raise RuntimeError("zstandard not available")
+        dictionary = zstandard.ZstdCompressionDict(
+            SCHEMA_DICTIONARY, dict_type=zstandard.DICT_TYPE_RAWCONTENT
+        )
+        self._compressor = zstandard.ZstdCompressor(level=level, dict_data=dictionary)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+
+def available_codecs() -> dict[str, FrameCodec]:
+    """Return the codecs usable in this environment keyed by subprotocol."""
+
+    codecs: dict[str, FrameCodec] = {}
+    if zstandard is not None:
+        codecs[ZstdCodec.subprotocol] = ZstdCodec()
+    codecs[DeflateCodec.subprotocol] = DeflateCodec()
+    return codecs
+
+
+def negotiate(requested: list[str], codecs: dict[str, FrameCodec]) -> Optional[str]:
+    """Pick the first subprotocol offered by the client that we can serve."""
+
+    for subprotocol in requested:
+        if subprotocol in codecs:
+            return subprotocol
+    return None
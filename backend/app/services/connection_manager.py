@@ -1,63 +1,97 @@
 import asyncio
 import json
-from typing import Any, Set
+from typing import Any, Optional, Set
 
 from fastapi import WebSocket
 
+from .compression import FrameCodec, available_codecs, negotiate
 
-class ConnectionManager:
-    """Manage WebSocket connections and broadcast payloads with rate limiting."""
 
-    def __init__(self, broadcast_hz: int = 5) -> None:
-        self._connections: Set[WebSocket] = set()
+class ConnectionManager:
+    """Manage WebSocket connections and broadcast payloads with rate limiting.
+
+    Clients may negotiate a compressed subprotocol (see ``compression``). Each
+    broadcast is then compressed once per codec and the same bytes are sent to
+    every subscriber using it, as a binary frame. Text frames are always plain JSON.
+    """
+
+    def __init__(
+        self, broadcast_hz: int = 5, codecs: Optional[dict[str, FrameCodec]] = None
+    ) -> None:
+        self._connections: dict[WebSocket, Optional[str]] = {}
+        self._codecs = available_codecs() if codecs is None else codecs
         self._lock = asyncio.Lock()
         self._min_interval = 1.0 / max(broadcast_hz, 1)
-        self._last_message: str | None = None
+        self._last_message: bytes | None = None
         self._last_sent_at: float = 0.0
 
+    @property
+    def subprotocols(self) -> list[str]:
+        return list(self._codecs)
+
     async def connect(self, websocket: WebSocket) -> None:
-        await websocket.accept()
+        subprotocol = negotiate(websocket.scope.get("subprotocols", []), self._codecs)
+        await websocket.accept(subprotocol=subprotocol)
         async with self._lock:
-            self._connections.add(websocket)
+            self._connections[websocket] = subprotocol
 
     async def disconnect(self, websocket: WebSocket) -> None:
         async with self._lock:
-            self._connections.discard(websocket)
+            self._connections.pop(websocket, None)
 
     async def broadcast(self, payload: dict[str, Any]) -> None:
+        await self.broadcast_encoded(json.dumps(payload).encode())
+
+    async def broadcast_encoded(self, message: bytes) -> None:
+        """Send an already JSON-encoded frame, compressing it at most once per codec."""
+
         if not self._connections:
             return
 
-        message = json.dumps(payload)
         if self._last_message == message:
             return
 
         await self._throttle()
 
+        text: str | None = None
+        compressed: dict[str, bytes] = {}
         to_remove: Set[WebSocket] = set()
         async with self._lock:
-            for connection in self._connections:
+            for connection, subprotocol in self._connections.items():
                 try:
-                    await connection.send_text(message)
+                    if subprotocol is None:
+                        if text is None:
+                            text = message.decode()
+                        await connection.send_text(text)
+                        continue
+                    data = compressed.get(subprotocol)
+                    if data is None:
+                        data = compressed[subprotocol] = self._codecs[subprotocol].compress(message)
+                    await connection.send_bytes(data)
                 except Exception:
                     to_remove.add(connection)
 
             for connection in to_remove:
-                self._connections.discard(connection)
+                self._connections.pop(connection, None)
 
         self._last_message = message
 
     async def broadcast_error(self, message: str) -> None:
+        await self.broadcast_event({"type": "error", "message": message})
+
+    async def broadcast_event(self, event: dict[str, Any]) -> None:
+        """Send a typed event to every client immediately, bypassing throttling and dedup."""
+
         if not self._connections:
             return
 
-        payload = json.dumps({"type": "error", "message": message})
+        payload = json.dumps(event)
         async with self._lock:
             for connection in list(self._connections):
                 try:
                     await connection.send_text(payload)
                 except Exception:
-                    self._connections.discard(connection)
+                    self._connections.pop(connection, None)
 
     async def _throttle(self) -> None:
         now = asyncio.get_event_loop().time()
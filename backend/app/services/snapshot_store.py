@@ -0,0 +1,93 @@
+import asyncio
+import json
+import uuid
+from typing import Iterable, Optional
+
+from ..telemetry.models import TelemetryFrame
+
+
+class SnapshotStore:
+    """Hold the latest telemetry frame, pre-encoded, with a monotonically increasing sequence.
+
+    ETags combine a per-process boot id with the sequence, so tags handed out before
+    a restart never match the new process's data.
+    """
+
+    def __init__(self) -> None:
+        self._boot = uuid.uuid4().hex[:8]
+        self._payload: dict | None = None
+        self._sequence = 0
+        self._encoded: dict[tuple[int, ...] | None, bytes] = {}
+        self._changed = asyncio.Event()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def etag(self) -> str:
+        return f'"{self._boot}-{self._sequence}"'
+
+    def publish(self, frame: TelemetryFrame) -> bytes:
+        """Store ``frame`` as the latest sample and return its JSON encoding.
+
+        The returned bytes are the one encoding of this tick; the broadcast loop hands
+        them on to the WebSocket fan-out and the recorder.
+        """
+
+        payload = frame.to_wire()
+        encoded = json.dumps(payload).encode()
+        self._payload = payload
+        self._sequence += 1
+        self._encoded = {None: encoded}
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return encoded
+
+    async def wait_for_change(self, after: int, timeout: float) -> int:
+        """Block until the sequence moves past ``after`` or ``timeout`` seconds elapse."""
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self._sequence <= after:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        return self._sequence
+
+    def parse_etag(self, value: Optional[str]) -> Optional[int]:
+        """Return the sequence named by an ``If-None-Match`` header issued by this process."""
+
+        if not value:
+            return None
+        for tag in value.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            boot, _, sequence = tag.strip('"').rpartition("-")
+            if boot == self._boot and sequence.isdigit():
+                return int(sequence)
+        return None
+
+    def encoded(self, gpu_ids: Optional[Iterable[int]] = None) -> Optional[bytes]:
+        """Return the encoded latest frame, optionally restricted to the given GPU ids.
+
+        Filtered encodings are cached until the next frame is published, so repeated
+        polls with the same filter only pay the encoding cost once per tick.
+        """
+
+        if self._payload is None:
+            return None
+
+        key = tuple(sorted(set(gpu_ids))) if gpu_ids else None
+        cached = self._encoded.get(key)
+        if cached is None:
+            payload = dict(self._payload)
+            payload["gpus"] = [gpu for gpu in self._payload["gpus"] if gpu["id"] in key]
+            cached = json.dumps(payload).encode()
+            self._encoded[key] = cached
+        return cached
@@ -1,7 +1,14 @@
 """Telemetry provider package."""
 
 from .base import TelemetryProvider
-
-__all__ = ["TelemetryProvider"]
+from .models import GpuSample, ProcessSample, SystemSample, TelemetryFrame
+
+__all__ = [
+    "GpuSample",
+    "ProcessSample",
+    "SystemSample",
+    "TelemetryFrame",
+    "TelemetryProvider",
+]
 
 
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import abc
-from typing import AsyncIterator, Dict, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from .models import TelemetryFrame
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..config import Settings
 
 
 class TelemetryProvider(abc.ABC):
@@ -13,6 +18,12 @@ class TelemetryProvider(abc.ABC):
         self.poll_interval_ms = poll_interval_ms
         self.include_system = include_system
 
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TelemetryProvider:
+        """Build the provider from application settings."""
+
+        return cls(settings.poll_interval_ms, settings.enable_system_metrics)
+
     async def start(self) -> None:
         """Lifecycle hook for startup."""
 
@@ -20,18 +31,18 @@ class TelemetryProvider(abc.ABC):
         """Lifecycle hook for shutdown."""
 
     @abc.abstractmethod
-    async def snapshot(self) -> Optional[Dict]:
+    async def snapshot(self) -> Optional[TelemetryFrame]:
         """Return a single telemetry snapshot or None when unavailable."""
 
-    async def stream(self) -> AsyncIterator[Dict]:
+    async def stream(self) -> AsyncIterator[TelemetryFrame]:
         """Default stream implementation using snapshot polling."""
         import asyncio
 
         interval = max(self.poll_interval_ms, 100) / 1000
         while True:
-            payload = await self.snapshot()
-            if payload:
-                yield payload
+            frame = await self.snapshot()
+            if frame:
+                yield frame
             await asyncio.sleep(interval)
 
 
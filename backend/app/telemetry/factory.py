@@ -8,6 +8,7 @@ from .base import TelemetryProvider
 from .nvidia_smi_provider import NvidiaSmiTelemetryProvider
 from .nvtop_provider import NvtopTelemetryProvider
 from .pynvml_provider import PynvmlTelemetryProvider
+from .replay_provider import ReplayTelemetryProvider
 
 LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +17,7 @@ PROVIDERS: dict[str, Type[TelemetryProvider]] = {
     "pynvml": PynvmlTelemetryProvider,
     "nvidia_smi": NvidiaSmiTelemetryProvider,
     "nvtop": NvtopTelemetryProvider,
+    "replay": ReplayTelemetryProvider,
 }
 
 
@@ -34,7 +36,7 @@ def get_telemetry_provider(settings: Settings) -> TelemetryProvider:
         if not provider_cls:
             continue
         try:
-            provider = provider_cls(settings.poll_interval_ms, settings.enable_system_metrics)
+            provider = provider_cls.from_settings(settings)
             LOGGER.info("Using telemetry provider", extra={"provider": provider.name})
             return provider
         except Exception as exc:
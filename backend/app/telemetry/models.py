@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True)
+class ProcessSample:
+    """A process holding memory on a GPU."""
+
+    pid: Optional[int]
+    name: Optional[str] = None
+    used_memory_mib: Optional[float] = None
+
+    @classmethod
+    def from_wire(cls, payload: Dict) -> ProcessSample:
+        return cls(
+            pid=payload.get("pid"),
+            name=payload.get("name"),
+            used_memory_mib=payload.get("usedMemoryMiB"),
+        )
+
+    def to_wire(self) -> Dict:
+        return {
+            "pid": self.pid,
+            "name": self.name,
+            "usedMemoryMiB": self.used_memory_mib,
+        }
+
+
+@dataclass(slots=True)
+class GpuSample:
+    """Readings for a single GPU at one tick, normalized across providers."""
+
+    id: int
+    uuid: Optional[str] = None
+    name: Optional[str] = None
+    driver_version: Optional[str] = None
+    cuda_version: Optional[int] = None
+    utilization: Optional[float] = None
+    memory_used: Optional[float] = None
+    memory_total: Optional[float] = None
+    memory_free: Optional[float] = None
+    temperature: Optional[float] = None
+    power_usage: Optional[float] = None
+    power_limit: Optional[float] = None
+    fan_speed: Optional[float] = None
+    encoder_utilization: Optional[float] = None
+    decoder_utilization: Optional[float] = None
+    processes: List[ProcessSample] = field(default_factory=list)
+
+    @classmethod
+    def from_wire(cls, payload: Dict) -> GpuSample:
+        return cls(
+            id=payload.get("id"),
+            uuid=payload.get("uuid"),
+            name=payload.get("name"),
+            driver_version=payload.get("driverVersion"),
+            cuda_version=payload.get("cudaVersion"),
+            utilization=payload.get("utilization"),
+            memory_used=payload.get("memoryUsed"),
+            memory_total=payload.get("memoryTotal"),
+            memory_free=payload.get("memoryFree"),
+            temperature=payload.get("temperature"),
+            power_usage=payload.get("powerUsage"),
+            power_limit=payload.get("powerLimit"),
+            fan_speed=payload.get("fanSpeed"),
+            encoder_utilization=payload.get("encoderUtilization"),
+            decoder_utilization=payload.get("decoderUtilization"),
+            processes=[ProcessSample.from_wire(proc) for proc in payload.get("processes", [])],
+        )
+
+    def to_wire(self) -> Dict:
+        return {
+            "id": self.id,
+            "uuid": self.uuid,
+            "name": self.name,
+            "driverVersion": self.driver_version,
+            "cudaVersion": self.cuda_version,
+            "utilization": self.utilization,
+            "memoryUsed": self.memory_used,
+            "memoryTotal": self.memory_total,
+            "memoryFree": self.memory_free,
+            "temperature": self.temperature,
+            "powerUsage": self.power_usage,
+            "powerLimit": self.power_limit,
+            "fanSpeed": self.fan_speed,
+            "encoderUtilization": self.encoder_utilization,
+            "decoderUtilization": self.decoder_utilization,
+            "processes": [proc.to_wire() for proc in self.processes],
+        }
+
+
+@dataclass(slots=True)
+class SystemSample:
+    """Host-level metrics gathered alongside GPU readings."""
+
+    cpu_usage: float
+    memory_usage: float
+    memory_used: int
+    memory_total: int
+    load_average: tuple[float, float, float]
+    uptime_seconds: int
+    hostname: str
+
+    @classmethod
+    def from_wire(cls, payload: Dict) -> SystemSample:
+        return cls(
+            cpu_usage=payload["cpuUsage"],
+            memory_usage=payload["memoryUsage"],
+            memory_used=payload["memoryUsed"],
+            memory_total=payload["memoryTotal"],
+            load_average=tuple(payload["loadAverage"]),
+            uptime_seconds=payload["uptimeSeconds"],
+            hostname=payload["hostname"],
+        )
+
+    def to_wire(self) -> Dict:
+        return {
+            "cpuUsage": self.cpu_usage,
+            "memoryUsage": self.memory_usage,
+            "memoryUsed": self.memory_used,
+            "memoryTotal": self.memory_total,
+            "loadAverage": list(self.load_average),
+            "uptimeSeconds": self.uptime_seconds,
+            "hostname": self.hostname,
+        }
+
+
+@dataclass(slots=True)
+class TelemetryFrame:
+    """One telemetry tick. ``timestamp`` is seconds since the epoch (UTC)."""
+
+    timestamp: float
+    gpus: List[GpuSample] = field(default_factory=list)
+    system: Optional[SystemSample] = None
+
+    @classmethod
+    def from_wire(cls, payload: Dict) -> TelemetryFrame:
+        """Rebuild a frame from its JSON payload, the inverse of :meth:`to_wire`."""
+
+        system = payload.get("system")
+        return cls(
+            timestamp=datetime.fromisoformat(payload["timestamp"]).timestamp(),
+            gpus=[GpuSample.from_wire(gpu) for gpu in payload.get("gpus", [])],
+            system=SystemSample.from_wire(system) if system else None,
+        )
+
+    def to_wire(self) -> Dict:
+        """Convert to the JSON payload sent to clients."""
+
+        payload: Dict = {
+            "timestamp": datetime.fromtimestamp(self.timestamp, timezone.utc).isoformat(),
+            "gpus": [gpu.to_wire() for gpu in self.gpus],
+        }
+        if self.system is not None:
+            payload["system"] = self.system.to_wire()
+        return payload
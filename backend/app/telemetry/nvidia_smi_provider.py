@@ -4,10 +4,11 @@ import json
 import logging
 import shlex
 import subprocess
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+import time
+from typing import List, Optional
 
 from .base import TelemetryProvider
+from .models import GpuSample, TelemetryFrame
 from .system_metrics import gather_system_metrics
 
 LOGGER = logging.getLogger(__name__)
@@ -35,7 +36,7 @@ class NvidiaSmiTelemetryProvider(TelemetryProvider):
     def __init__(self, poll_interval_ms: int = 1000, include_system: bool = True) -> None:
         super().__init__(poll_interval_ms, include_system)
 
-    async def snapshot(self) -> Optional[Dict]:
+    async def snapshot(self) -> Optional[TelemetryFrame]:
         command = [
             "nvidia-smi",
             f"--query-gpu={','.join(QUERY_FIELDS)}",
@@ -48,36 +49,29 @@ class NvidiaSmiTelemetryProvider(TelemetryProvider):
             LOGGER.error("Failed to execute nvidia-smi", exc_info=exc)
             return None
 
-        gpus: List[Dict] = []
+        timestamp = time.time()
+        gpus: List[GpuSample] = []
         for line in lines:
             parts = [part.strip() for part in line.split(",")]
             data = dict(zip(QUERY_FIELDS, parts))
             gpus.append(
-                {
-                    "id": int(data.get("index", 0)),
-                    "uuid": data.get("uuid"),
-                    "name": data.get("name"),
-                    "driverVersion": data.get("driver_version"),
-                    "utilization": try_parse_float(data.get("utilization.gpu")),
-                    "memoryUsed": try_parse_float(data.get("memory.used")),
-                    "memoryFree": try_parse_float(data.get("memory.free")),
-                    "memoryTotal": try_parse_float(data.get("memory.total")),
-                    "temperature": try_parse_float(data.get("temperature.gpu")),
-                    "powerUsage": try_parse_float(data.get("power.draw")),
-                    "powerLimit": try_parse_float(data.get("power.limit")),
-                    "processes": [],
-                }
+                GpuSample(
+                    id=int(data.get("index", 0)),
+                    uuid=data.get("uuid"),
+                    name=data.get("name"),
+                    driver_version=data.get("driver_version"),
+                    utilization=try_parse_float(data.get("utilization.gpu")),
+                    memory_used=try_parse_float(data.get("memory.used")),
+                    memory_free=try_parse_float(data.get("memory.free")),
+                    memory_total=try_parse_float(data.get("memory.total")),
+                    temperature=try_parse_float(data.get("temperature.gpu")),
+                    power_usage=try_parse_float(data.get("power.draw")),
+                    power_limit=try_parse_float(data.get("power.limit")),
+                )
             )
 
-        payload: Dict = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "gpus": gpus,
-        }
-
-        if self.include_system:
-            payload.update(gather_system_metrics())
-
-        return payload
+        system = gather_system_metrics() if self.include_system else None
+        return TelemetryFrame(timestamp=timestamp, gpus=gpus, system=system)
 
 
 def try_parse_float(value: Optional[str]) -> Optional[float]:  # pragma: no cover
@@ -3,10 +3,11 @@ from __future__ import annotations
 import json
 import logging
 import subprocess
-from datetime import datetime, timezone
-from typing import Dict, Optional
+import time
+from typing import Any, List, Optional
 
 from .base import TelemetryProvider
+from .models import GpuSample, ProcessSample, TelemetryFrame
 from .system_metrics import gather_system_metrics
 
 LOGGER = logging.getLogger(__name__)
@@ -18,7 +19,7 @@ class NvtopTelemetryProvider(TelemetryProvider):
     def __init__(self, poll_interval_ms: int = 1000, include_system: bool = True) -> None:
         super().__init__(poll_interval_ms, include_system)
 
-    async def snapshot(self) -> Optional[Dict]:
+    async def snapshot(self) -> Optional[TelemetryFrame]:
         try:
             result = subprocess.run(
                 ["nvtop", "--json"],
@@ -36,42 +37,54 @@ class NvtopTelemetryProvider(TelemetryProvider):
             LOGGER.error("Invalid nvtop JSON", exc_info=exc)
             return None
 
-        gpus = []
-        for gpu in data.get("gpus", []):
+        timestamp = time.time()
+        gpus: List[GpuSample] = []
+        for position, gpu in enumerate(data.get("gpus", [])):
+            memory = gpu.get("memory") or {}
+            index = parse_int(gpu.get("index"))
             gpus.append(
-                {
-                    "id": gpu.get("index"),
-                    "uuid": gpu.get("uuid"),
-                    "name": gpu.get("product_name"),
-                    "driverVersion": gpu.get("driver_version"),
-                    "utilization": gpu.get("utilization"),
-                    "memoryUsed": gpu.get("memory", {}).get("usedMiB"),
-                    "memoryTotal": gpu.get("memory", {}).get("totalMiB"),
-                    "temperature": gpu.get("temperatureC"),
-                    "powerUsage": gpu.get("powerW"),
-                    "powerLimit": gpu.get("powerLimitW"),
-                    "fanSpeed": gpu.get("fanSpeedPct"),
-                    "encoderUtilization": gpu.get("encoderUtilization"),
-                    "decoderUtilization": gpu.get("decoderUtilization"),
-                    "processes": [
-                        {
-                            "pid": proc.get("pid"),
-                            "name": proc.get("name"),
-                            "usedMemoryMiB": proc.get("usedMemoryMiB"),
-                        }
-                        for proc in gpu.get("processes", [])
+                GpuSample(
+                    id=position if index is None else index,
+                    uuid=gpu.get("uuid"),
+                    name=gpu.get("product_name"),
+                    driver_version=gpu.get("driver_version"),
+                    utilization=parse_float(gpu.get("utilization")),
+                    memory_used=parse_float(memory.get("usedMiB")),
+                    memory_total=parse_float(memory.get("totalMiB")),
+                    temperature=parse_float(gpu.get("temperatureC")),
+                    power_usage=parse_float(gpu.get("powerW")),
+                    power_limit=parse_float(gpu.get("powerLimitW")),
+                    fan_speed=parse_float(gpu.get("fanSpeedPct")),
+                    encoder_utilization=parse_float(gpu.get("encoderUtilization")),
+                    decoder_utilization=parse_float(gpu.get("decoderUtilization")),
+                    processes=[
+                        ProcessSample(
+                            pid=parse_int(proc.get("pid")),
+                            name=proc.get("name"),
+                            used_memory_mib=parse_float(proc.get("usedMemoryMiB")),
+                        )
+                        for proc in gpu.get("processes") or []
                     ],
-                }
+                )
             )
 
-        payload: Dict = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "gpus": gpus,
-        }
+        system = gather_system_metrics() if self.include_system else None
+        return TelemetryFrame(timestamp=timestamp, gpus=gpus, system=system)
 
-        if self.include_system:
-            payload.update(gather_system_metrics())
 
-        return payload
+def parse_float(value: Any) -> Optional[float]:
+    """Coerce an nvtop field such as ``42``, ``"42.5"`` or ``"42%"`` to float."""
 
+    if isinstance(value, str):
+        value = value.strip().rstrip("%")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
+
+def parse_int(value: Any) -> Optional[int]:
+    number = parse_float(value)
+    if number is None or not number.is_integer():
+        return None
+    return int(number)
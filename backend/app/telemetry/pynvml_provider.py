@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+import time
+from typing import List, Optional
 
 from .base import TelemetryProvider
+from .models import GpuSample, ProcessSample, TelemetryFrame
 from .system_metrics import gather_system_metrics
 
 LOGGER = logging.getLogger(__name__)
@@ -32,14 +33,15 @@ class PynvmlTelemetryProvider(TelemetryProvider):
         except Exception:  # pragma: no cover - defensive
             LOGGER.debug("pynvml shutdown failed", exc_info=True)
 
-    async def snapshot(self) -> Optional[Dict]:
+    async def snapshot(self) -> Optional[TelemetryFrame]:
         try:
             device_count = pynvml.nvmlDeviceGetCount()
         except Exception as exc:
             LOGGER.error("Failed to query GPU count", exc_info=exc)
             return None
 
-        gpus: List[Dict] = []
+        timestamp = time.time()
+        gpus: List[GpuSample] = []
         for index in range(device_count):
             handle = pynvml.nvmlDeviceGetHandleByIndex(index)
             memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
@@ -62,51 +64,38 @@ class PynvmlTelemetryProvider(TelemetryProvider):
                 )
             proc_info = safe_call(get_processes, handle) or []
 
-            processes = []
-            for proc in proc_info:
-                processes.append(
-                    {
-                        "pid": getattr(proc, "pid", None),
-                        "usedMemoryMiB": getattr(proc, "usedGpuMemory", 0)
-                        // (1024 * 1024),
-                        "name": safe_process_name(proc),
-                    }
+            processes = [
+                ProcessSample(
+                    pid=getattr(proc, "pid", None),
+                    name=safe_process_name(proc),
+                    used_memory_mib=getattr(proc, "usedGpuMemory", 0) // (1024 * 1024),
                 )
+                for proc in proc_info
+            ]
 
             gpus.append(
-                {
-                    "id": index,
-                    "name": pynvml.nvmlDeviceGetName(handle),
-                    "uuid": pynvml.nvmlDeviceGetUUID(handle),
-                    "driverVersion": pynvml.nvmlSystemGetDriverVersion(),
-                    "cudaVersion": safe_call(
-                        pynvml.nvmlSystemGetCudaDriverVersion_v2
-                    ),
-                    "utilization": getattr(utilization, "gpu", None)
-                    if utilization
-                    else None,
-                    "memoryUsed": bytes_to_mib(memory.used),
-                    "memoryTotal": bytes_to_mib(memory.total),
-                    "memoryFree": bytes_to_mib(memory.free),
-                    "temperature": temperature,
-                    "powerUsage": scale_milli(power_usage),
-                    "powerLimit": scale_milli(power_limit),
-                    "fanSpeed": fan_speed,
-                    "encoderUtilization": unpack_utilization(encoder_util),
-                    "decoderUtilization": unpack_utilization(decoder_util),
-                    "processes": processes,
-                }
+                GpuSample(
+                    id=index,
+                    name=pynvml.nvmlDeviceGetName(handle),
+                    uuid=pynvml.nvmlDeviceGetUUID(handle),
+                    driver_version=pynvml.nvmlSystemGetDriverVersion(),
+                    cuda_version=safe_call(pynvml.nvmlSystemGetCudaDriverVersion_v2),
+                    utilization=getattr(utilization, "gpu", None) if utilization else None,
+                    memory_used=bytes_to_mib(memory.used),
+                    memory_total=bytes_to_mib(memory.total),
+                    memory_free=bytes_to_mib(memory.free),
+                    temperature=temperature,
+                    power_usage=scale_milli(power_usage),
+                    power_limit=scale_milli(power_limit),
+                    fan_speed=fan_speed,
+                    encoder_utilization=unpack_utilization(encoder_util),
+                    decoder_utilization=unpack_utilization(decoder_util),
+                    processes=processes,
+                )
             )
 
-        payload: Dict = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "gpus": gpus,
-        }
-
-        if self.include_system:
-            payload.update(gather_system_metrics())
-
-        return payload
+        system = gather_system_metrics() if self.include_system else None
+        return TelemetryFrame(timestamp=timestamp, gpus=gpus, system=system)
 
 
 def safe_call(func, *args):  # pragma: no cover - small utility
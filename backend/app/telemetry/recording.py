@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+from .models import TelemetryFrame
+
+LOGGER = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# zlib window bits selecting the gzip container format.
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class TelemetryRecorder:
+    """Write telemetry frames to a gzip-compressed JSON-lines recording.
+
+    The gzip stream is sync-flushed at most every ``flush_interval_s`` seconds, so a
+    process that dies without closing the recorder loses at most that much data.
+    Each recorder starts a new file: if ``path`` already exists (possibly unfinished
+    after a crash), a numbered sibling such as ``capture-1.jsonl.gz`` is used instead.
+    ``write`` does blocking file I/O; call it from a worker thread inside the event loop.
+    """
+
+    def __init__(self, path: PathLike, flush_interval_s: float = 1.0) -> None:
+        self.path = Path(path)
+        self.flush_interval_s = flush_interval_s
+        self._file: BinaryIO | None = None
+        self._closed = False
+        self._flushed_at = 0.0
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("recorder is closed")
+            if self._file is None:
+                self.path = fresh_path(self.path)
+                self._file = gzip.open(self.path, "xb")
+                LOGGER.info("Recording telemetry", extra={"path": str(self.path)})
+
+    def close(self) -> None:
+        """Finish the recording. The recorder cannot be reopened afterwards."""
+
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def write(self, message: bytes) -> None:
+        """Append one JSON-encoded frame, as produced by ``SnapshotStore.publish``.
+
+        Frames written after :meth:`close` are dropped.
+        """
+
+        if self._closed:
+            return
+        if self._file is None:
+            self.open()
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(message)
+            self._file.write(b"\n")
+            now = time.monotonic()
+            if now - self._flushed_at >= self.flush_interval_s:
+                self._file.flush(zlib.Z_SYNC_FLUSH)
+                self._flushed_at = now
+
+    def __enter__(self) -> TelemetryRecorder:
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def fresh_path(path: Path) -> Path:
+    """Return ``path`` or, when it exists, the first unused numbered sibling."""
+
+    if not path.exists():
+        return path
+    name, dot, suffixes = path.name.partition(".")
+    counter = 1
+    while True:
+        candidate = path.with_name(f"{name}-{counter}{dot}{suffixes}")
+        if not candidate.exists():
+            return candidate
+        counter += 1
+
+
+def read_recording(path: PathLike) -> Iterator[TelemetryFrame]:
+    """Yield the frames stored in a recording written by :class:`TelemetryRecorder`.
+
+    Recordings from a process that died mid-write end without a gzip trailer and may
+    end in a partial line or corrupt data; everything up to the last complete frame is
+    still returned and the damage is logged.
+    """
+
+    pending = b""
+    try:
+        for data in decompress_members(path):
+            lines = (pending + data).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                if line.strip():
+                    yield TelemetryFrame.from_wire(json.loads(line))
+    except EOFError:
+        LOGGER.warning("Recording was not closed cleanly", extra={"path": str(path)})
+    except zlib.error as exc:
+        LOGGER.warning(
+            "Recording is corrupt; keeping frames read so far",
+            extra={"path": str(path), "error": str(exc)},
+        )
+    if pending.strip():
+        LOGGER.warning("Recording ends with a partial frame", extra={"path": str(path)})
+
+
+def decompress_members(path: PathLike, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the decompressed contents of concatenated gzip members.
+
+    Unlike ``gzip.open``, output that precedes corrupt data is yielded before the
+    ``zlib.error`` is raised, and a missing trailer raises ``EOFError`` only after all
+    recoverable data has been yielded.
+    """
+
+    with open(path, "rb") as handle:
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        in_member = False
+        data = b""
+        while True:
+            if not data:
+                data = handle.read(chunk_size)
+                if not data:
+                    if in_member:
+                        raise EOFError("recording ends inside a gzip member")
+                    return
+            in_member = True
+            checkpoint = decompressor.copy()
+            try:
+                output = decompressor.decompress(data)
+                data = b""
+            except zlib.error:
+                # Replay byte by byte to recover everything before the first bad byte;
+                # the byte that cannot be decoded re-raises the error.
+                decompressor = checkpoint
+                remaining, data, output = data, b"", b""
+                for index in range(len(remaining)):
+                    piece = decompressor.decompress(remaining[index : index + 1])
+                    if piece:
+                        yield piece
+                    if decompressor.eof:
+                        data = remaining[index + 1 :]
+                        break
+            if output:
+                yield output
+            if decompressor.eof:
+                data = decompressor.unused_data + data
+                decompressor = zlib.decompressobj(GZIP_WBITS)
+                in_member = False
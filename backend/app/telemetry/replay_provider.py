@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+
+from .base import TelemetryProvider
+from .models import TelemetryFrame
+from .recording import read_recording
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..config import Settings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ReplayTelemetryProvider(TelemetryProvider):
+    """Play back a recording made by ``TelemetryRecorder`` at real time or faster.
+
+    Recorded inter-frame gaps are preserved (divided by ``speed``) and every frame is
+    re-stamped with the current time, so downstream consumers treat it as live data.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        poll_interval_ms: int = 1000,
+        include_system: bool = True,
+        path: Optional[str] = None,
+        speed: float = 1.0,
+        loop: bool = True,
+    ) -> None:
+        if not path:
+            raise RuntimeError("replay path not configured")
+        if speed <= 0:
+            raise ValueError("replay speed must be positive")
+        super().__init__(poll_interval_ms, include_system)
+        self.speed = speed
+        self.loop = loop
+        self._frames: List[TelemetryFrame] = list(read_recording(path))
+        if not self._frames:
+            raise RuntimeError(f"recording {path} contains no frames")
+        self._cursor = 0
+        LOGGER.info(
+            "Loaded telemetry recording", extra={"path": path, "frames": len(self._frames)}
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ReplayTelemetryProvider:
+        return cls(
+            settings.poll_interval_ms,
+            settings.enable_system_metrics,
+            path=settings.replay_path,
+            speed=settings.replay_speed,
+            loop=settings.replay_loop,
+        )
+
+    async def snapshot(self) -> Optional[TelemetryFrame]:
+        if self._cursor >= len(self._frames):
+            if not self.loop:
+                return None
+            self._cursor = 0
+        frame = self._frames[self._cursor]
+        self._cursor += 1
+        return self._restamp(frame)
+
+    async def stream(self) -> AsyncIterator[TelemetryFrame]:
+        clock = asyncio.get_running_loop().time
+        gap = max(self.poll_interval_ms, 100) / 1000 / self.speed
+        while True:
+            # Schedule against the recording's own timeline so processing time does not drift.
+            started = clock()
+            origin = self._frames[0].timestamp
+            for frame in self._frames:
+                delay = started + (frame.timestamp - origin) / self.speed - clock()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                yield self._restamp(frame)
+            if not self.loop:
+                return
+            await asyncio.sleep(gap)
+
+    def _restamp(self, frame: TelemetryFrame) -> TelemetryFrame:
+        system = frame.system if self.include_system else None
+        return dataclasses.replace(frame, timestamp=time.time(), system=system)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import platform
 import time
-from typing import Dict
+from typing import Optional
+
+from .models import SystemSample
 
 
 try:  # pragma: no cover - optional dependency
@@ -11,25 +13,21 @@ except Exception:  # pragma: no cover - fallback path
     psutil = None  # type: ignore
 
 
-def gather_system_metrics() -> Dict:
+def gather_system_metrics() -> Optional[SystemSample]:
     if psutil is None:
-        return {}
+        return None
 
     cpu = psutil.cpu_percent(interval=None)
     memory = psutil.virtual_memory()
     load_avg = psutil.getloadavg() if hasattr(psutil, "getloadavg") else (0.0, 0.0, 0.0)
     boot_time = psutil.boot_time()
 
-    return {
-        "system": {
-            "cpuUsage": cpu,
-            "memoryUsage": round(memory.percent, 2),
-            "memoryUsed": memory.used,
-            "memoryTotal": memory.total,
-            "loadAverage": list(load_avg),
-            "uptimeSeconds": int(time.time() - boot_time),
-            "hostname": platform.node(),
-        }
-    }
-
-
+    return SystemSample(
+        cpu_usage=cpu,
+        memory_usage=round(memory.percent, 2),
+        memory_used=memory.used,
+        memory_total=memory.total,
+        load_average=tuple(load_avg),
+        uptime_seconds=int(time.time() - boot_time),
+        hostname=platform.node(),
+    )
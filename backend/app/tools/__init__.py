@@ -0,0 +1,2 @@
+"""Operational tooling for the backend."""
+
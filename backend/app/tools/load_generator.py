@@ -0,0 +1,123 @@
+"""Open many WebSocket clients against ``/ws/gpu`` and report fan-out throughput and latency.
+
+Latency is measured from each frame's sample timestamp to its receipt, so it includes
+the broadcast throttle (up to ``1 / GPU_MONITOR_WS_MAX_RATE_HZ``) as well as fan-out.
+Run the backend with the replay provider so timestamps reflect replay time, then::
+
+    python -m app.tools.load_generator --url ws://localhost:5000/ws/gpu --clients 2000 --duration 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import websockets
+
+from ..services.compression import SCHEMA_DICTIONARY, DeflateCodec
+
+
+@dataclass
+class LoadStats:
+    connected: int = 0
+    failed: int = 0
+    messages: int = 0
+    bytes_received: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+
+
+async def run_client(
+    url: str, measure_from: float, deadline: float, stats: LoadStats, subprotocol: Optional[str]
+) -> None:
+    subprotocols = [subprotocol] if subprotocol else None
+    try:
+        async with websockets.connect(url, subprotocols=subprotocols, max_size=None) as socket:
+            stats.connected += 1
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    message = await asyncio.wait_for(socket.recv(), remaining)
+                except asyncio.TimeoutError:
+                    return
+                received_at = time.time()
+                # Only count traffic once every client has had the chance to connect.
+                if time.monotonic() < measure_from:
+                    continue
+                if isinstance(message, bytes):
+                    stats.bytes_received += len(message)
+                    message = zlib.decompressobj(zdict=SCHEMA_DICTIONARY).decompress(message)
+                else:
+                    stats.bytes_received += len(message.encode())
+                payload = json.loads(message)
+                # Alert events also carry a timestamp; count telemetry frames only.
+                if "type" in payload or "timestamp" not in payload:
+                    continue
+                stats.messages += 1
+                sampled_at = datetime.fromisoformat(payload["timestamp"]).timestamp()
+                stats.latencies_ms.append((received_at - sampled_at) * 1000)
+    except Exception:
+        stats.failed += 1
+
+
+async def run_load(
+    url: str, clients: int, duration: float, ramp: float, subprotocol: Optional[str]
+) -> LoadStats:
+    stats = LoadStats()
+    measure_from = time.monotonic() + ramp
+    deadline = measure_from + duration
+    tasks = []
+    for _ in range(clients):
+        tasks.append(
+            asyncio.create_task(run_client(url, measure_from, deadline, stats, subprotocol))
+        )
+        if ramp:
+            await asyncio.sleep(ramp / clients)
+    await asyncio.gather(*tasks)
+    return stats
+
+
+def report(stats: LoadStats, duration: float) -> str:
+    """Summarize the measurement window (ramp-up excluded)."""
+
+    lines = [
+        f"clients connected: {stats.connected} (failed: {stats.failed})",
+        f"messages received: {stats.messages} ({stats.messages / duration:.1f}/s)",
+        f"bytes received: {stats.bytes_received} ({stats.bytes_received / duration:.0f} B/s)",
+    ]
+    if len(stats.latencies_ms) >= 2:
+        quantiles = statistics.quantiles(stats.latencies_ms, n=100)
+        lines.append(
+            "sample-to-receipt latency ms: p50={:.1f} p95={:.1f} p99={:.1f} max={:.1f}".format(
+                quantiles[49], quantiles[94], quantiles[98], max(stats.latencies_ms)
+            )
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="ws://localhost:5000/ws/gpu")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to measure")
+    parser.add_argument("--ramp", type=float, default=5.0, help="Seconds spent opening clients")
+    parser.add_argument(
+        "--compressed", action="store_true", help=f"Negotiate {DeflateCodec.subprotocol}"
+    )
+    args = parser.parse_args()
+
+    subprotocol = DeflateCodec.subprotocol if args.compressed else None
+    stats = asyncio.run(run_load(args.url, args.clients, args.duration, args.ramp, subprotocol))
+    print(report(stats, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import pytest
+
+from app.services.alerts import AlertEngine, AlertRule, load_rules
+from app.telemetry.models import GpuSample, TelemetryFrame
+
+
+def frame(timestamp, *gpus):
+    return TelemetryFrame(timestamp=timestamp, gpus=list(gpus))
+
+
+def test_rule_fires_after_duration_and_resolves():
+    rule = AlertRule(id="hot", metric="temperature", op=">", threshold=85, for_s=30)
+    engine = AlertEngine([rule])
+    assert engine.evaluate(frame(0, GpuSample(id=0, temperature=90))) == []
+    assert engine.evaluate(frame(20, GpuSample(id=0, temperature=91))) == []
+
+    events = engine.evaluate(frame(30, GpuSample(id=0, temperature=92)))
+    assert [(e["rule"], e["gpu"], e["state"]) for e in events] == [("hot", 0, "firing")]
+    assert engine.evaluate(frame(31, GpuSample(id=0, temperature=93))) == []
+    assert len(engine.active) == 1
+
+    events = engine.evaluate(frame(32, GpuSample(id=0, temperature=70)))
+    assert [e["state"] for e in events] == ["resolved"]
+    assert engine.active == []
+    assert len(engine.recent) == 2
+
+
+def test_condition_interruption_resets_duration():
+    rule = AlertRule(id="hot", metric="temperature", op=">", threshold=85, for_s=10)
+    engine = AlertEngine([rule])
+    engine.evaluate(frame(0, GpuSample(id=0, temperature=90)))
+    engine.evaluate(frame(5, GpuSample(id=0, temperature=80)))
+    assert engine.evaluate(frame(10, GpuSample(id=0, temperature=90))) == []
+    assert engine.evaluate(frame(20, GpuSample(id=0, temperature=90)))
+
+
+def test_rising_trend_is_required():
+    rule = AlertRule(
+        id="mem", metric="memoryPercent", op=">", threshold=95, trend="rising", window_s=2
+    )
+    engine = AlertEngine([rule])
+    assert engine.evaluate(frame(0, GpuSample(id=0, memory_used=97, memory_total=100))) == []
+    assert engine.evaluate(frame(1, GpuSample(id=0, memory_used=97, memory_total=100))) == []
+    events = engine.evaluate(frame(2, GpuSample(id=0, memory_used=99, memory_total=100)))
+    assert [e["state"] for e in events] == ["firing"]
+
+
+def test_gpus_are_tracked_independently():
+    engine = AlertEngine([AlertRule(id="busy", metric="utilization", op=">=", threshold=90)])
+    events = engine.evaluate(
+        frame(0, GpuSample(id=3, utilization=95), GpuSample(id=7, utilization=10))
+    )
+    assert [e["gpu"] for e in events] == [3]
+    events = engine.evaluate(
+        frame(1, GpuSample(id=3, utilization=95), GpuSample(id=7, utilization=99))
+    )
+    assert [e["gpu"] for e in events] == [7]
+
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        AlertRule(id="bad", metric="nope", op=">", threshold=1)
+    with pytest.raises(ValueError):
+        AlertEngine([AlertRule(id="a", metric="temperature", op=">", threshold=1)] * 2)
+
+
+def test_load_rules(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text('[{"id": "hot", "metric": "temperature", "op": ">", "threshold": 85}]')
+    assert load_rules(path)[0].threshold == 85
+
+
+def test_alerts_for_missing_gpus_are_resolved():
+    engine = AlertEngine([AlertRule(id="busy", metric="utilization", op=">=", threshold=90)])
+    engine.evaluate(frame(0, GpuSample(id=0, utilization=95), GpuSample(id=1, utilization=95)))
+    assert len(engine.active) == 2
+
+    events = engine.evaluate(frame(1, GpuSample(id=0, utilization=95)))
+    assert [(e["gpu"], e["state"], e["reason"]) for e in events] == [(1, "resolved", "gpu-missing")]
+    assert [alert["gpu"] for alert in engine.active] == [0]
+
+    events = engine.evaluate(frame(2))
+    assert [(e["gpu"], e["state"]) for e in events] == [(0, "resolved")]
+    assert engine.active == []
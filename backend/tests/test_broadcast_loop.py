@@ -0,0 +1,74 @@
+import pytest
+
+from app import main
+from app.services.snapshot_store import SnapshotStore
+from app.telemetry.models import GpuSample, TelemetryFrame
+
+
+class FiniteProvider:
+    def __init__(self, frames):
+        self.frames = frames
+
+    async def stream(self):
+        for frame in self.frames:
+            yield frame
+
+
+class RecordingManager:
+    def __init__(self):
+        self.messages = []
+        self.events = []
+
+    async def broadcast_encoded(self, message):
+        self.messages.append(message)
+
+    async def broadcast_event(self, event):
+        self.events.append(event)
+
+
+class FailingRecorder:
+    def __init__(self):
+        self.writes = 0
+        self.closed = False
+
+    def write(self, message):
+        self.writes += 1
+        raise OSError("disk full")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    frames = [TelemetryFrame(timestamp=float(index), gpus=[GpuSample(id=0)]) for index in range(3)]
+    manager = RecordingManager()
+    monkeypatch.setattr(main, "telemetry_provider", FiniteProvider(frames))
+    monkeypatch.setattr(main, "connection_manager", manager)
+    monkeypatch.setattr(main, "snapshot_store", SnapshotStore())
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_failing_recorder_is_disabled_without_stopping_broadcasts(monkeypatch, manager):
+    recorder = FailingRecorder()
+    monkeypatch.setattr(main, "recorder", recorder)
+    await main.broadcast_loop()
+    assert len(manager.messages) == 3
+    assert recorder.writes == 1
+    assert recorder.closed
+
+
+@pytest.mark.asyncio
+async def test_alert_evaluation_errors_do_not_stop_broadcasts(monkeypatch, manager):
+    class BrokenEngine:
+        rules = ["rule"]
+
+        def evaluate(self, frame):
+            raise TypeError("'>' not supported between instances of 'str' and 'float'")
+
+    monkeypatch.setattr(main, "recorder", None)
+    monkeypatch.setattr(main, "alert_engine", BrokenEngine())
+    await main.broadcast_loop()
+    assert len(manager.messages) == 3
+    assert manager.events == []
@@ -1,21 +1,31 @@
 import asyncio
+import json
+import zlib
 
 import pytest
 
+from app.services.compression import SCHEMA_DICTIONARY, DeflateCodec, FrameCodec
 from app.services.connection_manager import ConnectionManager
+from app.telemetry.models import GpuSample, TelemetryFrame
 
 
 class DummyWebSocket:
-    def __init__(self):
+    def __init__(self, subprotocols=()):
+        self.scope = {"subprotocols": list(subprotocols)}
         self.sent = []
         self.accepted = False
+        self.subprotocol = None
 
-    async def accept(self):
+    async def accept(self, subprotocol=None):
         self.accepted = True
+        self.subprotocol = subprotocol
 
     async def send_text(self, data):
         self.sent.append(data)
 
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
 
 @pytest.mark.asyncio
 async def test_broadcast_debounces_identical_payloads():
@@ -37,3 +47,40 @@ async def test_disconnect_removes_connection():
     assert ws not in manager._connections
 
 
+@pytest.mark.asyncio
+async def test_broadcast_encoded_sends_text_to_plain_clients():
+    manager = ConnectionManager(broadcast_hz=1000)
+    ws = DummyWebSocket()
+    await manager.connect(ws)
+    frame = TelemetryFrame(timestamp=0.0, gpus=[GpuSample(id=0, temperature=50.0)])
+    await manager.broadcast_encoded(json.dumps(frame.to_wire()).encode())
+    assert len(ws.sent) == 1
+    assert json.loads(ws.sent[0])["gpus"][0]["temperature"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_compressed_subscribers_share_one_compressed_frame():
+    codecs = {DeflateCodec.subprotocol: DeflateCodec()}
+    manager = ConnectionManager(broadcast_hz=1000, codecs=codecs)
+    plain = DummyWebSocket()
+    first = DummyWebSocket(subprotocols=["unknown", DeflateCodec.subprotocol])
+    second = DummyWebSocket(subprotocols=[DeflateCodec.subprotocol])
+    for ws in (plain, first, second):
+        await manager.connect(ws)
+
+    assert plain.subprotocol is None
+    assert first.subprotocol == DeflateCodec.subprotocol
+
+    await manager.broadcast({"gpus": [{"id": 0}]})
+    assert first.sent[0] is second.sent[0]
+
+    decompressor = zlib.decompressobj(zdict=SCHEMA_DICTIONARY)
+    assert decompressor.decompress(first.sent[0]).decode() == plain.sent[0]
+
+
+def test_incomplete_codec_cannot_be_instantiated():
+    class IncompleteCodec(FrameCodec):
+        subprotocol = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteCodec()
@@ -1,8 +1,12 @@
+import json
+
 import pytest
 
 from app.config import Settings
 from app.telemetry import factory
 from app.telemetry.base import TelemetryProvider
+from app.telemetry.models import TelemetryFrame
+from app.telemetry.recording import TelemetryRecorder
 
 
 class DummyProvider(TelemetryProvider):
@@ -26,3 +30,11 @@ def test_factory_raises_when_no_provider(monkeypatch):
         factory.get_telemetry_provider(settings)
 
 
+def test_factory_builds_replay_provider_from_settings(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    with TelemetryRecorder(path) as recorder:
+        recorder.write(json.dumps(TelemetryFrame(timestamp=0.0).to_wire()).encode())
+    settings = Settings(telemetry_provider="replay", replay_path=str(path), replay_speed=4)
+    provider = factory.get_telemetry_provider(settings)
+    assert provider.name == "replay"
+    assert provider.speed == 4
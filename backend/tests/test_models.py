@@ -0,0 +1,52 @@
+from app.telemetry.models import GpuSample, ProcessSample, SystemSample, TelemetryFrame
+
+
+def make_frame(temperature=60.0):
+    return TelemetryFrame(
+        timestamp=0.0,
+        gpus=[
+            GpuSample(
+                id=0,
+                name="Test GPU",
+                memory_used=1024.0,
+                memory_total=8192.0,
+                temperature=temperature,
+                processes=[ProcessSample(pid=42, name="python", used_memory_mib=512)],
+            )
+        ],
+    )
+
+
+def test_frame_to_wire_uses_camel_case_and_iso_timestamp():
+    payload = make_frame().to_wire()
+    assert payload["timestamp"] == "1970-01-01T00:00:00+00:00"
+    gpu = payload["gpus"][0]
+    assert gpu["memoryUsed"] == 1024.0
+    assert gpu["fanSpeed"] is None
+    assert gpu["processes"] == [{"pid": 42, "name": "python", "usedMemoryMiB": 512}]
+    assert "system" not in payload
+
+
+def test_frame_to_wire_includes_system():
+    frame = make_frame()
+    frame.system = SystemSample(
+        cpu_usage=10.0,
+        memory_usage=50.0,
+        memory_used=1,
+        memory_total=2,
+        load_average=(0.1, 0.2, 0.3),
+        uptime_seconds=5,
+        hostname="host",
+    )
+    assert frame.to_wire()["system"]["loadAverage"] == [0.1, 0.2, 0.3]
+
+
+def test_frames_compare_field_by_field():
+    assert make_frame() == make_frame()
+    assert make_frame() != make_frame(temperature=61.0)
+
+
+def test_from_wire_round_trips():
+    frame = make_frame()
+    frame.timestamp = 1700000000.25
+    assert TelemetryFrame.from_wire(frame.to_wire()) == frame
@@ -0,0 +1,58 @@
+import json
+import subprocess
+
+import pytest
+
+from app.telemetry import nvtop_provider
+from app.telemetry.nvtop_provider import NvtopTelemetryProvider, parse_float, parse_int
+
+
+def test_parse_float_accepts_numbers_and_numeric_strings():
+    assert parse_float(42) == 42.0
+    assert parse_float(" 42.5 ") == 42.5
+    assert parse_float("42%") == 42.0
+    assert parse_float("N/A") is None
+    assert parse_float(None) is None
+    assert parse_float({"value": 1}) is None
+
+
+def test_parse_int_rejects_fractions():
+    assert parse_int("3") == 3
+    assert parse_int(3.0) == 3
+    assert parse_int(3.5) is None
+    assert parse_int(None) is None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_coerces_nvtop_values(monkeypatch):
+    payload = {
+        "gpus": [
+            {
+                "index": None,
+                "utilization": "87%",
+                "memory": {"usedMiB": "1024", "totalMiB": 8192},
+                "temperatureC": "N/A",
+                "processes": [{"pid": "1234", "name": "python", "usedMemoryMiB": "512"}],
+            },
+            {"index": "1", "memory": None, "powerW": 120, "processes": None},
+        ]
+    }
+
+    def fake_run(*args, **kwargs):
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps(payload), stderr="")
+
+    monkeypatch.setattr(nvtop_provider.subprocess, "run", fake_run)
+    frame = await NvtopTelemetryProvider(include_system=False).snapshot()
+
+    first, second = frame.gpus
+    assert first.id == 0
+    assert first.utilization == 87.0
+    assert first.memory_used == 1024.0
+    assert first.memory_total == 8192.0
+    assert first.temperature is None
+    assert first.processes[0].pid == 1234
+    assert first.processes[0].used_memory_mib == 512.0
+    assert second.id == 1
+    assert second.memory_used is None
+    assert second.power_usage == 120.0
+    assert second.processes == []
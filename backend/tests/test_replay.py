@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from app.telemetry.models import GpuSample, TelemetryFrame
+from app.telemetry.recording import TelemetryRecorder, read_recording
+from app.telemetry.replay_provider import ReplayTelemetryProvider
+
+
+def write_recording(path, count=3):
+    with TelemetryRecorder(path) as recorder:
+        for index in range(count):
+            gpus = [GpuSample(id=0, utilization=index)]
+            frame = TelemetryFrame(timestamp=1000.0 + index, gpus=gpus)
+            recorder.write(json.dumps(frame.to_wire()).encode())
+
+
+def test_recording_round_trips(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    write_recording(path)
+    frames = list(read_recording(path))
+    assert [frame.gpus[0].utilization for frame in frames] == [0, 1, 2]
+    assert frames[0].timestamp == 1000.0
+
+
+def test_replay_requires_path():
+    with pytest.raises(RuntimeError):
+        ReplayTelemetryProvider()
+
+
+@pytest.mark.asyncio
+async def test_replay_stream_plays_recording_at_speed(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    write_recording(path)
+    provider = ReplayTelemetryProvider(path=str(path), speed=1000.0, loop=False)
+    frames = [frame async for frame in provider.stream()]
+    assert [frame.gpus[0].utilization for frame in frames] == [0, 1, 2]
+    assert all(frame.timestamp > 1000.0 for frame in frames)
+
+
+@pytest.mark.asyncio
+async def test_replay_snapshot_loops(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    write_recording(path, count=2)
+    provider = ReplayTelemetryProvider(path=str(path))
+    values = [(await provider.snapshot()).gpus[0].utilization for _ in range(3)]
+    assert values == [0, 1, 0]
+
+
+def test_recording_survives_unclosed_writer(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    recorder = TelemetryRecorder(path, flush_interval_s=0)
+    for index in range(50):
+        frame = TelemetryFrame(timestamp=float(index), gpus=[GpuSample(id=0, utilization=index)])
+        recorder.write(json.dumps(frame.to_wire()).encode())
+
+    # The writer is still open: no gzip trailer has been written yet.
+    assert len(list(read_recording(path))) == 50
+
+    truncated = tmp_path / "truncated.jsonl.gz"
+    truncated.write_bytes(path.read_bytes()[:-7])
+    frames = list(read_recording(truncated))
+    assert 0 < len(frames) <= 50
+    assert [frame.gpus[0].utilization for frame in frames] == list(range(len(frames)))
+    recorder.close()
+
+
+def test_restart_after_crash_does_not_append_to_unfinished_recording(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    crashed = TelemetryRecorder(path, flush_interval_s=0)
+    for index in range(5):
+        crashed.write(json.dumps(TelemetryFrame(timestamp=float(index)).to_wire()).encode())
+
+    with TelemetryRecorder(path) as restarted:
+        for index in range(3):
+            restarted.write(json.dumps(TelemetryFrame(timestamp=float(index)).to_wire()).encode())
+
+    assert restarted.path == tmp_path / "capture-1.jsonl.gz"
+    assert len(list(read_recording(path))) == 5
+    assert len(list(read_recording(restarted.path))) == 3
+
+    # A recording appended onto an unfinished member still yields its leading frames.
+    spliced = tmp_path / "spliced.jsonl.gz"
+    spliced.write_bytes(path.read_bytes() + restarted.path.read_bytes())
+    assert len(list(read_recording(spliced))) == 5
+    crashed.close()
+
+
+def test_closed_recorder_does_not_reopen(tmp_path):
+    path = tmp_path / "capture.jsonl.gz"
+    recorder = TelemetryRecorder(path)
+    recorder.write(json.dumps(TelemetryFrame(timestamp=0.0).to_wire()).encode())
+    recorder.close()
+    recorder.write(json.dumps(TelemetryFrame(timestamp=1.0).to_wire()).encode())
+    assert len(list(read_recording(path))) == 1
+    assert sorted(tmp_path.iterdir()) == [path]
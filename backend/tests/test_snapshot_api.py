@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.services.snapshot_store import SnapshotStore
+from app.telemetry.models import GpuSample, TelemetryFrame
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = SnapshotStore()
+    monkeypatch.setattr(main, "snapshot_store", store)
+    return store
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def publish(store, timestamp=0.0):
+    store.publish(TelemetryFrame(timestamp=timestamp, gpus=[GpuSample(id=0), GpuSample(id=1)]))
+
+
+def test_snapshot_unavailable_before_first_sample(store, client):
+    assert client.get("/api/snapshot").status_code == 503
+    assert client.get("/api/snapshot", headers={"If-None-Match": '"0"'}).status_code == 503
+
+
+def test_snapshot_serves_etag_and_not_modified(store, client):
+    publish(store)
+    response = client.get("/api/snapshot", params={"gpu": 1})
+    assert response.status_code == 200
+    assert [gpu["id"] for gpu in response.json()["gpus"]] == [1]
+
+    etag = response.headers["ETag"]
+    assert client.get("/api/snapshot", headers={"If-None-Match": etag}).status_code == 304
+
+    publish(store, timestamp=1.0)
+    assert client.get("/api/snapshot", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_snapshot_ignores_tags_from_another_process(store, client):
+    other = SnapshotStore()
+    publish(other)
+    publish(store)
+    started = time.monotonic()
+    response = client.get(
+        "/api/snapshot", params={"wait": 5}, headers={"If-None-Match": other.etag}
+    )
+    assert response.status_code == 200
+    assert time.monotonic() - started < 1
+
+
+def test_snapshot_long_poll_times_out_with_not_modified(store, client):
+    publish(store)
+    etag = client.get("/api/snapshot").headers["ETag"]
+    response = client.get("/api/snapshot", params={"wait": 0.05}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
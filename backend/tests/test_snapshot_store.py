@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import pytest
+
+from app.services.snapshot_store import SnapshotStore
+from app.telemetry.models import GpuSample, TelemetryFrame
+
+
+def make_frame(timestamp=0.0):
+    return TelemetryFrame(timestamp=timestamp, gpus=[GpuSample(id=0), GpuSample(id=1)])
+
+
+def test_publish_bumps_sequence_and_returns_encoding():
+    store = SnapshotStore()
+    assert store.encoded() is None
+    message = store.publish(make_frame())
+    assert store.sequence == 1
+    assert store.encoded() is message
+    store.publish(make_frame(timestamp=1.0))
+    assert store.sequence == 2
+
+
+def test_encoded_filters_gpus():
+    store = SnapshotStore()
+    store.publish(make_frame())
+    payload = json.loads(store.encoded([1]))
+    assert [gpu["id"] for gpu in payload["gpus"]] == [1]
+    assert store.encoded([1]) is store.encoded([1])
+
+
+def test_etag_is_scoped_to_the_process():
+    store = SnapshotStore()
+    store.publish(make_frame())
+    assert store.parse_etag(store.etag) == 1
+    assert store.parse_etag(f"W/{store.etag}") == 1
+    assert store.parse_etag('"1"') is None
+    assert SnapshotStore().parse_etag(store.etag) is None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_change_returns_on_publish():
+    store = SnapshotStore()
+    waiter = asyncio.create_task(store.wait_for_change(0, timeout=5))
+    await asyncio.sleep(0)
+    store.publish(make_frame())
+    assert await waiter == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_change_times_out():
+    store = SnapshotStore()
+    assert await store.wait_for_change(0, timeout=0.01) == 0
@@ -42,8 +42,12 @@ export const useGpuStream = () => {
 
       lastPayloadRef.current = event.data;
       try {
-        const parsed = JSON.parse(event.data) as TelemetryPayload;
-        setData(parsed);
+        const parsed = JSON.parse(event.data);
+        // Typed messages (alerts, errors) share the socket but are not telemetry frames.
+        if (typeof parsed.type === "string") {
+          return;
+        }
+        setData(parsed as TelemetryPayload);
       } catch (err) {
         console.error("Failed to parse telemetry payload", err);
       }